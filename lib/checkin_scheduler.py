@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List
 
 from .checkin_handler import CheckInHandler
 from .flight import Flight
-from .general import CheckInError, make_request
+from .general import MAX_CONNECTIONS, CheckInError, make_request
 from .log import get_logger
 from .webdriver import WebDriver
 
@@ -37,8 +38,17 @@ class CheckInScheduler:
 
         prev_flight_len = len(self.flights)
 
-        for confirmation_number in confirmation_numbers:
-            self._schedule_flights(confirmation_number)
+        # The same reservation can be listed more than once, so only retrieve each one once
+        confirmation_numbers = list(dict.fromkeys(confirmation_numbers))
+
+        # Each retrieval is spent waiting on the network, so retrieve all reservations
+        # concurrently (limited to avoid being rate limited by Southwest). The threads are
+        # finished before scheduling because scheduling a check-in forks a new process.
+        with ThreadPoolExecutor(max_workers=MAX_CONNECTIONS) as executor:
+            reservations = list(executor.map(self._get_reservation_info, confirmation_numbers))
+
+        for confirmation_number, reservation_info in zip(confirmation_numbers, reservations):
+            self._schedule_flights(confirmation_number, reservation_info)
 
         self.notification_handler.new_flights(self.flights[prev_flight_len:])
 
@@ -53,27 +63,31 @@ class CheckInScheduler:
         )
         current_time = datetime.utcnow()
 
-        for flight in self.flights[:]:
-            if flight.departure_time < current_time:
-                self.flights.remove(flight)
+        self.flights = [flight for flight in self.flights if flight.departure_time >= current_time]
 
         logger.debug(
             "Successfully removed departed flights. %d flights are now scheduled", len(self.flights)
         )
 
-    def _schedule_flights(self, confirmation_number: str) -> None:
-        reservation_info = self._get_reservation_info(confirmation_number)
+    def _schedule_flights(
+        self, confirmation_number: str, reservation_info: List[Dict[str, Any]]
+    ) -> None:
         logger.debug("%d flights found under current reservation", len(reservation_info))
 
+        # Index the scheduled flights once so each lookup is a hash probe instead of a scan
+        scheduled_flights = set(self.flights)
+
         # If multiple flights are under the same confirmation number, it will schedule all checkins
         for flight_info in reservation_info:
-            flight = Flight(flight_info, confirmation_number)
+            # Skip departed flights before parsing their departure time and timezone
+            if flight_info["departureStatus"] == "DEPARTED":
+                continue
 
-            if flight_info["departureStatus"] != "DEPARTED" and not self._flight_is_scheduled(
-                flight
-            ):
+            flight = Flight(flight_info, confirmation_number)
+            if flight not in scheduled_flights:
                 logger.debug("New flight found. Handling check-in")
                 self.flights.append(flight)
+                scheduled_flights.add(flight)
                 checkin_handler = CheckInHandler(self, flight)
                 checkin_handler.schedule_check_in()
 
@@ -95,14 +109,3 @@ class CheckInScheduler:
         logger.debug("Successfully retrieved reservation info")
         reservation_info = response["viewReservationViewPage"]["bounds"]
         return reservation_info
-
-    def _flight_is_scheduled(self, flight: Flight) -> bool:
-        for scheduled_flight in self.flights:
-            if (
-                flight.departure_time == scheduled_flight.departure_time
-                and flight.departure_airport == scheduled_flight.departure_airport
-                and flight.destination_airport == scheduled_flight.destination_airport
-            ):
-                return True
-
-        return False
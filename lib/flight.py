@@ -3,13 +3,22 @@ from __future__ import annotations
 import json
 import os
 from datetime import datetime
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
 import pytz
 
 TZ_FILE_PATH = "utils/airport_timezones.json"
 
 
+@lru_cache(maxsize=None)
+def load_airport_timezones() -> Dict[str, str]:
+    """The timezones file is large, so it is only read once and reused for every flight"""
+    project_dir = os.path.dirname(os.path.dirname(__file__))
+    with open(project_dir + "/" + TZ_FILE_PATH) as tz:
+        return json.load(tz)
+
+
 class Flight:
     """
     A helper class that parses necessary information from JSON received from the Southwest API.
@@ -23,6 +32,20 @@ class Flight:
         self.destination_airport = flight_info["arrivalAirport"]["name"]
         self.departure_time = self._get_flight_time(flight_info)
 
+    def __eq__(self, other: object) -> bool:
+        # Two flights are the same if they leave from the same airport at the same time
+        # and fly to the same destination
+        if not isinstance(other, Flight):
+            return NotImplemented
+
+        return self._get_identity() == other._get_identity()
+
+    def __hash__(self) -> int:
+        return hash(self._get_identity())
+
+    def _get_identity(self) -> Tuple[datetime, str, str]:
+        return (self.departure_time, self.departure_airport, self.destination_airport)
+
     def _get_flight_time(self, flight: Dict[str, Any]) -> datetime:
         flight_date = f"{flight['departureDate']} {flight['departureTime']}"
         departure_airport_code = flight["departureAirport"]["code"]
@@ -33,16 +56,15 @@ class Flight:
 
     @staticmethod
     def _get_airport_timezone(airport_code: str) -> Any:
-        project_dir = os.path.dirname(os.path.dirname(__file__))
-        with open(project_dir + "/" + TZ_FILE_PATH) as tz:
-            airport_timezones = json.load(tz)
-
+        airport_timezones = load_airport_timezones()
         airport_timezone = pytz.timezone(airport_timezones[airport_code])
         return airport_timezone
 
     @staticmethod
     def _convert_to_utc(flight_date: str, airport_timezone: Any) -> datetime:
-        flight_date = datetime.strptime(flight_date, "%Y-%m-%d %H:%M")
+        # The date is always in "YYYY-MM-DD HH:MM" format, which fromisoformat parses
+        # much faster than strptime
+        flight_date = datetime.fromisoformat(flight_date)
         flight_time = airport_timezone.localize(flight_date)
         utc_time = flight_time.astimezone(pytz.utc).replace(tzinfo=None)
 
@@ -29,11 +29,7 @@ class FlightRetriever:
 
     def schedule_reservations(self, flights: List[Dict[str, Any]]) -> None:
         logger.debug("Scheduling reservations for %d flights", len(flights))
-        confirmation_numbers = []
-
-        for flight in flights:
-            confirmation_numbers.append(flight["confirmationNumber"])
-
+        confirmation_numbers = [flight["confirmationNumber"] for flight in flights]
         self.checkin_scheduler.schedule(confirmation_numbers)
 
 
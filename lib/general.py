@@ -1,43 +1,163 @@
 import logging
+import os
+import random
 import time
 from enum import IntEnum
 from typing import Any, Dict
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE_URL = "https://mobile.southwest.com/api/"
+# (connect, read) timeouts so a half-open connection can't stall the retry loop
+REQUEST_TIMEOUT = (5, 15)
+# The most requests that are ever sent to Southwest at the same time. This is also
+# the number of connections kept alive so concurrent requests never open extra ones.
+MAX_CONNECTIONS = 4
+# How many times a request is sent before giving up
+MAX_ATTEMPTS = 20
+# Retrying won't change the outcome of these responses, so fail immediately
+NON_RETRYABLE_STATUS_CODES = (401, 403, 404)
+# Never wait longer than this between attempts, even if Southwest asks for it
+MAX_RETRY_AFTER = 30
+# Requests that get no response at all are given up on sooner. A single request can
+# take about 37 seconds (three 5s connection retries, then a 5s connect and a 15s
+# read), so a GET fails after about two minutes at worst. A POST is never re-sent,
+# so it fails after about 37 seconds.
+MAX_FAILED_REQUESTS = 3
 logger = logging.getLogger(__name__)
 
 
+def _create_session() -> requests.Session:
+    """
+    Create a session that keeps connections to the Southwest API alive so
+    consecutive requests don't each pay for a new TCP and TLS handshake.
+    """
+    session = requests.Session()
+
+    # Failed connections are retried here with urllib3's backoff. Nothing has been sent
+    # yet at that point, so this is safe for every method. Read errors are raised as-is
+    # and handled in make_request, along with error responses, because Southwest's
+    # status codes need special handling (e.g. a 400 before check-in opens).
+    retries = Retry(total=3, connect=3, read=False, status=0, backoff_factor=0.25)
+
+    # Every request goes to the same host, so only one connection pool is needed
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONNECTIONS, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
+
+
+def _reset_session() -> None:
+    # A forked process (such as a check-in) must not share pooled sockets with its parent
+    global SESSION  # pylint:disable=global-statement
+    SESSION = _create_session()
+
+
+SESSION = _create_session()
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reset_session)
+
+
 def make_request(
     method: str, site: str, headers: Dict[str, Any], info: Dict[str, str]
 ) -> Dict[str, Any]:
     url = BASE_URL + site
 
+    # Everything that stays the same between attempts is set up before the retry loop
+    if method == "POST":
+        send_request = SESSION.post
+        data = {"json": info}
+    else:
+        send_request = SESSION.get
+        data = {"params": info}
+
     # In the case that your server and the Southwest server aren't in sync,
     # this requests multiple times for a better chance at success when checking in
     attempts = 0
-    while attempts < 20:
-        if method == "POST":
-            response = requests.post(url, headers=headers, json=info)
-        else:
-            response = requests.get(url, headers=headers, params=info)
+    failed_requests = 0
+    while True:
+        try:
+            response = send_request(url, headers=headers, timeout=REQUEST_TIMEOUT, **data)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as err:
+            # A timed out or dropped request counts as a failed attempt
+            attempts += 1
+            failed_requests += 1
+            response = None
+            error = f"{type(err).__name__}: {err}"
+            logger.debug("Request attempt failed: %s", error)
+
+            # Southwest may have already processed a POST (such as a check-in) that didn't
+            # get a response, so it is never sent again
+            if (
+                method == "POST"
+                or failed_requests >= MAX_FAILED_REQUESTS
+                or attempts >= MAX_ATTEMPTS
+            ):
+                break
+
+            time.sleep(_get_backoff_delay(failed_requests))
+            continue
 
         if response.status_code == 200:
             logger.debug("Successfully made request after %d attempts", attempts)
-            return response.json()
+            # orjson parses the response much faster than the standard library
+            return orjson.loads(response.content)
 
         attempts += 1
-        time.sleep(0.5)
+        # Don't wait after the last attempt since no more requests will be sent
+        if response.status_code in NON_RETRYABLE_STATUS_CODES or attempts >= MAX_ATTEMPTS:
+            break
+
+        time.sleep(_get_retry_delay(response, attempts))
+
+    status_code = None
+    if response is not None:
+        status_code = response.status_code
+        error = response.reason + " " + str(status_code)
+
+    logger.debug("Failed to make %s request after %d attempts: %s", method, attempts, error)
+    raise CheckInError(error, status_code=status_code, url=url, method=method, attempts=attempts)
+
 
-    error = response.reason + " " + str(response.status_code)
-    logger.debug("Failed to make request: %s", error)
-    raise CheckInError(error)
+def _get_retry_delay(response: requests.Response, attempts: int) -> float:
+    # Southwest responds with a 400 until check-in opens, so keep polling at a steady
+    # rate to check in as soon as possible
+    if response.status_code == 400:
+        return 0.5
 
+    retry_after = response.headers.get("Retry-After")
+    if response.status_code == 429 and retry_after is not None:
+        try:
+            return max(0.0, min(float(retry_after), MAX_RETRY_AFTER))
+        except ValueError:
+            logger.debug("Ignoring unsupported Retry-After header: %s", retry_after)
 
-# Make a custom exception when a check-in fails
+    return _get_backoff_delay(attempts)
+
+
+def _get_backoff_delay(attempts: int) -> float:
+    # Exponential backoff with jitter for throttling, server errors, and failed requests
+    return min(4.0, 0.25 * 2 ** (attempts - 1)) + random.uniform(0, 0.25)
+
+
+# Make a custom exception when a check-in fails. Details about the failed request are
+# kept to make failures easier to debug
 class CheckInError(Exception):
-    pass
+    def __init__(
+        self,
+        *args: Any,
+        status_code: int = None,
+        url: str = None,
+        method: str = None,
+        attempts: int = None,
+    ) -> None:
+        super().__init__(*args)
+        self.status_code = status_code
+        self.url = url
+        self.method = method
+        self.attempts = attempts
 
 
 # Make a custom exception when a login fails
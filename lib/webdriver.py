@@ -28,6 +28,10 @@ RESERVATION_URL = BASE_URL + "/api/mobile-air-operations/v1/mobile-air-operation
 # Southwest's code when logging in with the incorrect information
 INVALID_CREDENTIALS_CODE = 400518024
 
+# Headers needed to make requests to the Southwest API. Compiled once since every
+# header of every captured request is checked against it.
+NEEDED_HEADERS_PATTERN = re.compile(r"x-api-key|x-channel-id|user-agent|^[\w-]+?-\w$", re.I)
+
 logger = get_logger(__name__)
 
 
@@ -189,12 +193,11 @@ class WebDriver:
 
     @staticmethod
     def _get_needed_headers(request_headers: Dict[str, Any]) -> Dict[str, Any]:
-        headers = {}
-        for header in request_headers:
-            if re.match(r"x-api-key|x-channel-id|user-agent|^[\w-]+?-\w$", header, re.I):
-                headers[header] = request_headers[header]
-
-        return headers
+        return {
+            header: request_headers[header]
+            for header in request_headers
+            if NEEDED_HEADERS_PATTERN.match(header)
+        }
 
     @staticmethod
     def _set_account_name(
@@ -1,5 +1,4 @@
 from datetime import datetime
-from typing import Any, Dict
 from unittest import mock
 
 import pytest
@@ -59,16 +58,36 @@ def test_schedule_does_not_refresh_headers_when_populated(mocker: MockerFixture)
 
 def test_schedule_schedules_all_reservations(mocker: MockerFixture) -> None:
     mocker.patch.object(CheckInScheduler, "refresh_headers")
+    mocker.patch.object(
+        CheckInScheduler, "_get_reservation_info", side_effect=lambda number: [number]
+    )
     mock_schedule_flights = mocker.patch.object(CheckInScheduler, "_schedule_flights")
     mock_new_flight_notifications = mocker.patch.object(NotificationHandler, "new_flights")
 
     checkin_scheduler = CheckInScheduler(FlightRetriever(Config()))
     checkin_scheduler.schedule(["test1", "test2"])
 
-    mock_schedule_flights.assert_has_calls([mock.call("test1"), mock.call("test2")])
+    mock_schedule_flights.assert_has_calls(
+        [mock.call("test1", ["test1"]), mock.call("test2", ["test2"])]
+    )
     mock_new_flight_notifications.assert_called_once()
 
 
+def test_schedule_retrieves_duplicate_reservations_once(mocker: MockerFixture) -> None:
+    mocker.patch.object(CheckInScheduler, "refresh_headers")
+    mock_get_reservation_info = mocker.patch.object(
+        CheckInScheduler, "_get_reservation_info", return_value=[]
+    )
+    mock_schedule_flights = mocker.patch.object(CheckInScheduler, "_schedule_flights")
+    mocker.patch.object(NotificationHandler, "new_flights")
+
+    checkin_scheduler = CheckInScheduler(FlightRetriever(Config()))
+    checkin_scheduler.schedule(["test1", "test2", "test1"])
+
+    assert mock_get_reservation_info.call_count == 2
+    mock_schedule_flights.assert_has_calls([mock.call("test1", []), mock.call("test2", [])])
+
+
 def test_refresh_headers_sets_new_headers(mocker: MockerFixture) -> None:
     mock_webdriver_set_headers = mocker.patch.object(WebDriver, "set_headers")
 
@@ -103,14 +122,11 @@ def test_schedule_flights_schedules_all_flights_under_reservation(
     mocker: MockerFixture,
 ) -> None:
     reservation_info = [{"departureStatus": "WAITING"}, {"departureStatus": "WAITING"}]
-    mocker.patch.object(CheckInScheduler, "_get_reservation_info", return_value=reservation_info)
-
-    mocker.patch.object(CheckInScheduler, "_flight_is_scheduled", return_value=False)
-    mocker.patch("lib.checkin_scheduler.Flight")
+    mocker.patch("lib.checkin_scheduler.Flight", side_effect=[mock.Mock(), mock.Mock()])
     mock_schedule_check_in = mocker.patch.object(CheckInHandler, "schedule_check_in")
 
     checkin_scheduler = CheckInScheduler(FlightRetriever(Config()))
-    checkin_scheduler._schedule_flights("flight1")
+    checkin_scheduler._schedule_flights("flight1", reservation_info)
 
     assert len(checkin_scheduler.flights) == 2
     assert mock_schedule_check_in.call_count == 2
@@ -120,26 +136,24 @@ def test_schedule_flights_does_not_schedule_already_scheduled_flights(
     mocker: MockerFixture,
 ) -> None:
     reservation_info = [{"departureStatus": "WAITING"}]
-    mocker.patch.object(CheckInScheduler, "_get_reservation_info", return_value=reservation_info)
-
-    mocker.patch.object(CheckInScheduler, "_flight_is_scheduled", return_value=True)
-    mocker.patch("lib.checkin_scheduler.Flight")
+    mock_flight = mocker.patch("lib.checkin_scheduler.Flight")
 
     checkin_scheduler = CheckInScheduler(FlightRetriever(Config()))
-    checkin_scheduler._schedule_flights("flight1")
+    checkin_scheduler.flights.append(mock_flight.return_value)
+    checkin_scheduler._schedule_flights("flight1", reservation_info)
 
-    assert len(checkin_scheduler.flights) == 0
+    assert len(checkin_scheduler.flights) == 1
 
 
 def test_schedule_flights_does_not_schedule_departed_flights(mocker: MockerFixture) -> None:
     reservation_info = [{"departureStatus": "DEPARTED"}]
-    mocker.patch.object(CheckInScheduler, "_get_reservation_info", return_value=reservation_info)
-    mocker.patch("lib.checkin_scheduler.Flight")
+    mock_flight = mocker.patch("lib.checkin_scheduler.Flight")
 
     checkin_scheduler = CheckInScheduler(FlightRetriever(Config()))
-    checkin_scheduler._schedule_flights("flight1")
+    checkin_scheduler._schedule_flights("flight1", reservation_info)
 
     assert len(checkin_scheduler.flights) == 0
+    mock_flight.assert_not_called()
 
 
 def test_get_reservation_info_returns_reservation_info(mocker: MockerFixture) -> None:
@@ -165,49 +179,3 @@ def test_get_reservation_info_sends_error_notification_when_reservation_retrieva
 
     mock_failed_reservation_retrieval.assert_called_once()
     assert reservation_info == []
-
-
-def test_flight_is_scheduled_returns_true_if_flight_is_already_scheduled(
-    test_flight: Flight,
-) -> None:
-    checkin_scheduler = CheckInScheduler(FlightRetriever(Config()))
-
-    test_flight.departure_time = datetime(1999, 12, 31)
-    test_flight.departure_airport = "test_departure"
-    test_flight.destination_airport = "test_destination"
-    checkin_scheduler.flights.append(test_flight)
-
-    assert checkin_scheduler._flight_is_scheduled(test_flight) is True
-
-
-@pytest.mark.parametrize(
-    ["flight_info", "flight_time"],
-    [
-        (
-            {"departureAirport": {"name": None}, "arrivalAirport": {"name": None}},
-            datetime(1999, 12, 30),
-        ),
-        (
-            {"departureAirport": {"name": "test"}, "arrivalAirport": {"name": None}},
-            datetime(1999, 12, 31),
-        ),
-        (
-            {"departureAirport": {"name": None}, "arrivalAirport": {"name": "test"}},
-            datetime(1999, 12, 31),
-        ),
-    ],
-)
-def test_flight_is_scheduled_returns_false_if_flight_is_not_scheduled(
-    test_flight: Flight,
-    flight_info: Dict[str, Any],
-    flight_time: datetime,
-) -> None:
-    checkin_scheduler = CheckInScheduler(FlightRetriever(Config()))
-
-    test_flight.departure_time = datetime(1999, 12, 31)
-    checkin_scheduler.flights.append(test_flight)
-
-    new_flight = Flight(flight_info, "")
-    new_flight.departure_time = flight_time
-
-    assert checkin_scheduler._flight_is_scheduled(new_flight) is False
@@ -1,17 +1,24 @@
 import os
 from datetime import datetime
+from typing import Any, Dict
 from unittest import mock
 
 import pytest
 import pytz
 from pytest_mock import MockerFixture
 
-from lib.flight import TZ_FILE_PATH, Flight
+from lib.flight import TZ_FILE_PATH, Flight, load_airport_timezones
 
 # This needs to be accessed to be tested
 # pylint: disable=protected-access
 
 
+@pytest.fixture(autouse=True)
+def clear_airport_timezones() -> None:
+    # Don't let a cached (or mocked) file leak between tests
+    load_airport_timezones.cache_clear()
+
+
 @pytest.fixture
 def test_flight() -> Flight:
     flight_info = {"departureAirport": {"name": None}, "arrivalAirport": {"name": None}}
@@ -56,8 +63,71 @@ def test_get_airport_timezone_returns_the_correct_timezone(
     )
 
 
+def test_get_airport_timezone_only_reads_the_timezones_file_once(
+    mocker: MockerFixture, test_flight: Flight
+) -> None:
+    mock_open = mocker.patch(
+        "lib.flight.open", mock.mock_open(read_data='{"test_code": "Asia/Calcutta"}')
+    )
+    test_flight._get_airport_timezone("test_code")
+    test_flight._get_airport_timezone("test_code")
+
+    mock_open.assert_called_once()
+
+
 def test_convert_to_utc_converts_local_time_to_utc(test_flight: Flight) -> None:
     tz = pytz.timezone("Asia/Calcutta")
     utc_flight_time = test_flight._convert_to_utc("1999-12-31 23:59", tz)
 
     assert utc_flight_time == datetime(1999, 12, 31, 18, 29)
+
+
+def test_flights_are_equal_if_they_have_the_same_time_and_airports(test_flight: Flight) -> None:
+    test_flight.departure_time = datetime(1999, 12, 31)
+    test_flight.departure_airport = "test_departure"
+    test_flight.destination_airport = "test_destination"
+
+    with mock.patch.object(Flight, "_get_flight_time", return_value=datetime(1999, 12, 31)):
+        new_flight = Flight(
+            {
+                "departureAirport": {"name": "test_departure"},
+                "arrivalAirport": {"name": "test_destination"},
+            },
+            "other_num",
+        )
+
+    assert new_flight == test_flight
+    assert hash(new_flight) == hash(test_flight)
+
+
+@pytest.mark.parametrize(
+    ["flight_info", "flight_time"],
+    [
+        (
+            {"departureAirport": {"name": None}, "arrivalAirport": {"name": None}},
+            datetime(1999, 12, 30),
+        ),
+        (
+            {"departureAirport": {"name": "test"}, "arrivalAirport": {"name": None}},
+            datetime(1999, 12, 31),
+        ),
+        (
+            {"departureAirport": {"name": None}, "arrivalAirport": {"name": "test"}},
+            datetime(1999, 12, 31),
+        ),
+    ],
+)
+def test_flights_are_not_equal_if_time_or_airports_differ(
+    test_flight: Flight, flight_info: Dict[str, Any], flight_time: datetime
+) -> None:
+    test_flight.departure_time = datetime(1999, 12, 31)
+
+    with mock.patch.object(Flight, "_get_flight_time", return_value=flight_time):
+        new_flight = Flight(flight_info, "test_num")
+
+    assert new_flight != test_flight
+    assert new_flight not in {test_flight}
+
+
+def test_flight_is_not_equal_to_other_types(test_flight: Flight) -> None:
+    assert test_flight != "test_num"
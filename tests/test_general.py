@@ -1,19 +1,33 @@
+from typing import Dict
+
 import pytest
+import requests
 import requests_mock
 from pytest_mock import MockerFixture
+from urllib3.exceptions import ReadTimeoutError
 
 from lib import general
 
+# This needs to be accessed to be tested
+# pylint: disable=protected-access
+
 
 def test_make_request_raises_exception_on_failure(
     requests_mock: requests_mock.mocker.Mocker, mocker: MockerFixture
 ) -> None:
-    mocker.patch("time.sleep")
+    mock_sleep = mocker.patch("time.sleep")
     requests_mock.post(general.BASE_URL + "test", status_code=400, reason="error")
 
-    with pytest.raises(general.CheckInError):
+    with pytest.raises(general.CheckInError) as err:
         general.make_request("POST", "test", {}, {})
 
+    assert str(err.value) == "error 400"
+    assert err.value.status_code == 400
+    assert err.value.url == general.BASE_URL + "test"
+    assert err.value.method == "POST"
+    assert err.value.attempts == general.MAX_ATTEMPTS
+    assert mock_sleep.call_count == err.value.attempts - 1
+
 
 def test_make_request_correctly_posts_data(requests_mock: requests_mock.mocker.Mocker) -> None:
     mock_post = requests_mock.post(
@@ -44,3 +58,190 @@ def test_make_request_correctly_gets_data(requests_mock: requests_mock.mocker.Mo
     assert last_request.method == "GET"
     assert last_request.url == general.BASE_URL + "test?test=params"
     assert last_request.headers["header"] == "test"
+
+
+def test_make_request_reuses_the_same_session(requests_mock: requests_mock.mocker.Mocker) -> None:
+    requests_mock.get(general.BASE_URL + "test", status_code=200, text="{}")
+    session = general.SESSION
+
+    general.make_request("GET", "test", {}, {})
+    general.make_request("GET", "test", {}, {})
+
+    assert general.SESSION is session
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.timeout == general.REQUEST_TIMEOUT
+
+
+def test_reset_session_creates_a_new_session(mocker: MockerFixture) -> None:
+    session = mocker.patch.object(general, "SESSION")
+    general._reset_session()
+
+    assert general.SESSION is not session
+    assert isinstance(general.SESSION.get_adapter(general.BASE_URL), general.HTTPAdapter)
+
+
+def test_session_retries_connection_errors_but_not_responses() -> None:
+    retries = general.SESSION.get_adapter(general.BASE_URL).max_retries
+
+    assert retries.connect == 3
+    assert retries.status == 0
+
+    # A read error means the request was already sent, so it is never retried here
+    read_error = ReadTimeoutError(None, general.BASE_URL, "timed out")
+    for method in ["GET", "POST"]:
+        with pytest.raises(ReadTimeoutError):
+            retries.increment(method, general.BASE_URL, error=read_error)
+
+
+def test_make_request_raises_check_in_error_when_connection_retries_run_out(
+    requests_mock: requests_mock.mocker.Mocker, mocker: MockerFixture
+) -> None:
+    mocker.patch("time.sleep")
+    requests_mock.post(
+        general.BASE_URL + "test", exc=requests.exceptions.ConnectionError("Max retries exceeded")
+    )
+
+    with pytest.raises(general.CheckInError) as err:
+        general.make_request("POST", "test", {}, {})
+
+    assert str(err.value) == "ConnectionError: Max retries exceeded"
+
+
+def test_make_request_does_not_retry_non_retryable_errors(
+    requests_mock: requests_mock.mocker.Mocker, mocker: MockerFixture
+) -> None:
+    mock_sleep = mocker.patch("time.sleep")
+    requests_mock.get(general.BASE_URL + "test", status_code=404, reason="error")
+
+    with pytest.raises(general.CheckInError):
+        general.make_request("GET", "test", {}, {})
+
+    assert requests_mock.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.parametrize(["status_code", "headers"], [(503, {}), (429, {"Retry-After": "30"})])
+def test_make_request_does_not_wait_after_the_last_attempt(
+    requests_mock: requests_mock.mocker.Mocker,
+    mocker: MockerFixture,
+    status_code: int,
+    headers: Dict[str, str],
+) -> None:
+    mock_sleep = mocker.patch("time.sleep")
+    requests_mock.get(
+        general.BASE_URL + "test", status_code=status_code, reason="error", headers=headers
+    )
+
+    with pytest.raises(general.CheckInError) as err:
+        general.make_request("GET", "test", {}, {})
+
+    assert err.value.attempts == general.MAX_ATTEMPTS
+    assert mock_sleep.call_count == err.value.attempts - 1
+
+
+def test_make_request_raises_check_in_error_when_requests_time_out(
+    requests_mock: requests_mock.mocker.Mocker, mocker: MockerFixture
+) -> None:
+    mock_sleep = mocker.patch("time.sleep")
+    requests_mock.get(general.BASE_URL + "test", exc=requests.exceptions.ReadTimeout("timed out"))
+
+    with pytest.raises(general.CheckInError) as err:
+        general.make_request("GET", "test", {}, {})
+
+    assert str(err.value) == "ReadTimeout: timed out"
+    assert err.value.status_code is None
+    assert err.value.method == "GET"
+    assert err.value.attempts == general.MAX_FAILED_REQUESTS
+    assert requests_mock.call_count == general.MAX_FAILED_REQUESTS
+    assert mock_sleep.call_count == err.value.attempts - 1
+
+
+def test_make_request_does_not_retry_invalid_requests(
+    requests_mock: requests_mock.mocker.Mocker, mocker: MockerFixture
+) -> None:
+    mock_sleep = mocker.patch("time.sleep")
+    requests_mock.get(general.BASE_URL + "test", exc=requests.exceptions.InvalidHeader)
+
+    with pytest.raises(requests.exceptions.InvalidHeader):
+        general.make_request("GET", "test", {}, {})
+
+    assert requests_mock.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_make_request_does_not_resend_post_requests_that_time_out(
+    requests_mock: requests_mock.mocker.Mocker, mocker: MockerFixture
+) -> None:
+    mock_sleep = mocker.patch("time.sleep")
+    requests_mock.post(general.BASE_URL + "test", exc=requests.exceptions.ReadTimeout("timed out"))
+
+    with pytest.raises(general.CheckInError) as err:
+        general.make_request("POST", "test", {}, {})
+
+    assert str(err.value) == "ReadTimeout: timed out"
+    assert err.value.attempts == 1
+    assert requests_mock.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_make_request_retries_get_requests_that_time_out(
+    requests_mock: requests_mock.mocker.Mocker, mocker: MockerFixture
+) -> None:
+    mocker.patch("time.sleep")
+    requests_mock.get(
+        general.BASE_URL + "test",
+        [
+            {"exc": requests.exceptions.ReadTimeout},
+            {"status_code": 200, "text": '{"success": "retry"}'},
+        ],
+    )
+
+    response = general.make_request("GET", "test", {}, {})
+
+    assert response == {"success": "retry"}
+    assert requests_mock.call_count == 2
+
+
+def test_make_request_retries_until_success(
+    requests_mock: requests_mock.mocker.Mocker, mocker: MockerFixture
+) -> None:
+    mocker.patch("time.sleep")
+    requests_mock.get(
+        general.BASE_URL + "test",
+        [{"status_code": 503}, {"status_code": 200, "text": '{"success": "get"}'}],
+    )
+
+    response = general.make_request("GET", "test", {}, {})
+
+    assert response == {"success": "get"}
+    assert requests_mock.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ["status_code", "headers", "attempts", "expected_delay"],
+    [
+        (400, {}, 5, 0.5),
+        (429, {"Retry-After": "3"}, 1, 3),
+        (429, {"Retry-After": "-5"}, 1, 0),
+        (429, {"Retry-After": "100000"}, 1, general.MAX_RETRY_AFTER),
+        (429, {"Retry-After": "inf"}, 1, general.MAX_RETRY_AFTER),
+        (429, {"Retry-After": "nan"}, 1, 0),
+        (429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 1, 0.25),
+        (503, {}, 1, 0.25),
+        (503, {}, 3, 1),
+        (503, {}, 10, 4),
+    ],
+)
+def test_get_retry_delay_returns_correct_delay(
+    mocker: MockerFixture,
+    status_code: int,
+    headers: Dict[str, str],
+    attempts: int,
+    expected_delay: float,
+) -> None:
+    mocker.patch("random.uniform", return_value=0)
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+
+    assert general._get_retry_delay(response, attempts) == expected_delay